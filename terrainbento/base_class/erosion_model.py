@@ -3,7 +3,6 @@
 """Base class for common functions of all terrainbento erosion models."""
 
 import os
-import sys
 import time as tm
 import warnings
 
@@ -540,6 +539,7 @@ class ErosionModel(object):
         ###################################################################
         _verify_boundary_handler(boundary_handlers)
         self.boundary_handlers = boundary_handlers
+        self._precip_changer = boundary_handlers.get("PrecipChanger")
 
         # Instantiate all the output writers and store in a list
         self.all_output_writers = self._setup_output_writers(
@@ -1257,6 +1257,8 @@ class ErosionModel(object):
 
 def main():  # pragma: no cover
     """Executes model."""
+    import sys
+
     try:
         infile = sys.argv[1]
     except IndexError:
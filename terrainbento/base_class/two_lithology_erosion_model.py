@@ -75,6 +75,10 @@ class TwoLithologyErosionModel(ErosionModel):
 
         # Get all common parameters
         self.contact_width = contact_zone__width
+        if self.contact_width > 0.0:
+            self._inv_contact_width = 1.0 / self.contact_width
+        else:
+            self._inv_contact_width = None
 
         self.regolith_transport_parameter = regolith_transport_parameter
 
@@ -100,6 +104,10 @@ class TwoLithologyErosionModel(ErosionModel):
         # Create array for erodibility weighting function
         self.erody_wt = np.zeros(self.grid.number_of_nodes)
 
+        # Create a reusable buffer for the weighting function at core nodes
+        self._core_nodes = self.grid.core_nodes
+        self._erody_buf = np.empty(self._core_nodes.size)
+
         # Set values correctly
         self._update_erodywt()
         self._update_erodibility_field()
@@ -119,31 +127,38 @@ class TwoLithologyErosionModel(ErosionModel):
         # Create array for erodibility weighting function
         self.erody_wt = np.zeros(self.grid.number_of_nodes)
 
+        # Create a reusable buffer for the weighting function at core nodes
+        self._core_nodes = self.grid.core_nodes
+        self._erody_buf = np.empty(self._core_nodes.size)
+
         # set values correctly
         self._update_erodywt()
         self._update_erodibility_and_threshold_fields()
 
     def _update_erodywt(self):
         # Update the erodibility weighting function (this is "F")
-        core = self.grid.core_nodes
+        core = self._core_nodes
         if self.contact_width > 0.0:
-            self.erody_wt[core] = 1.0 / (
-                1.0
-                + np.exp(
-                    -(self.z[core] - self.rock_till_contact[core])
-                    / self.contact_width
-                )
-            )
+            # Evaluate the sigmoid in place to avoid a temporary array per
+            # operation.
+            buf = self._erody_buf
+            np.take(self.z, core, out=buf)
+            buf -= self.rock_till_contact[core]
+            np.multiply(buf, -self._inv_contact_width, out=buf)
+            np.exp(buf, out=buf)
+            buf += 1.0
+            np.reciprocal(buf, out=buf)
+            self.erody_wt[core] = buf
         else:
             self.erody_wt[core] = 0.0
             self.erody_wt[np.where(self.z > self.rock_till_contact)[0]] = 1.0
 
     def _update_Ks_with_precip(self):
         # (if we're varying K through time, update that first)
-        if "PrecipChanger" in self.boundary_handlers:
-            erode_factor = self.boundary_handlers[
-                "PrecipChanger"
-            ].get_erodibility_adjustment_factor()
+        if self._precip_changer is not None:
+            erode_factor = (
+                self._precip_changer.get_erodibility_adjustment_factor()
+            )
             self.till_erody = self.K_till * erode_factor
             self.rock_erody = self.K_rock * erode_factor
 
@@ -159,10 +174,10 @@ class TwoLithologyErosionModel(ErosionModel):
         self._update_Ks_with_precip()
 
         # Calculate the effective erodibilities using weighted averaging
-        self.erody[:] = (
-            self.erody_wt * self.till_erody
-            + (1.0 - self.erody_wt) * self.rock_erody
+        np.multiply(
+            self.erody_wt, self.till_erody - self.rock_erody, out=self.erody
         )
+        self.erody += self.rock_erody
 
     def _update_erodibility_and_threshold_fields(self):
         """Update erodibility at each node.
@@ -176,10 +191,10 @@ class TwoLithologyErosionModel(ErosionModel):
         self._update_Ks_with_precip()
 
         # Calculate the effective erodibilities using weighted averaging
-        self.erody[:] = (
-            self.erody_wt * self.till_erody
-            + (1.0 - self.erody_wt) * self.rock_erody
+        np.multiply(
+            self.erody_wt, self.till_erody - self.rock_erody, out=self.erody
         )
+        self.erody += self.rock_erody
 
         # Calculate the effective thresholds using weighted averaging
         self.threshold[:] = (
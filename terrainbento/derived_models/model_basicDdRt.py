@@ -14,6 +14,7 @@ Landlab components used:
     4. `LinearDiffuser <https://landlab.readthedocs.io/en/master/reference/components/diffusion.html>`_
 """
 
+import numpy as np
 from landlab.components import LinearDiffuser, StreamPowerSmoothThresholdEroder
 
 from terrainbento.base_class import TwoLithologyErosionModel
@@ -163,13 +164,19 @@ class BasicDdRt(TwoLithologyErosionModel):
         # Set up rock-till boundary and associated grid fields.
         self._setup_rock_and_till()
 
+        # Bind the fields used to update the threshold.
+        self._init_z = self.grid.at_node["initial_topographic__elevation"]
+        self._cum_ero = self.grid.at_node["cumulative_elevation_change"]
+
         # Create a field for the (initial) erosion threshold
         self.threshold = self.grid.add_zeros(
             "node", "water_erosion_rule__threshold"
         )
         self.threshold[:] = self.threshold_value
 
-        # Instantiate a StreamPowerSmoothThresholdEroder component
+        # Instantiate a StreamPowerSmoothThresholdEroder component. The eroder
+        # keeps a reference to the threshold field rather than a copy, so the
+        # threshold must always be updated in place.
         self.eroder = StreamPowerSmoothThresholdEroder(
             self.grid,
             K_sp=self.erody,
@@ -196,19 +203,24 @@ class BasicDdRt(TwoLithologyErosionModel):
         #
         # Note that a minus sign is used because cum ero depth is negative for
         # erosion, positive for deposition.
-        # The second line handles the case where there is growth, in which case
-        # we want the threshold to stay at its initial value rather than
-        # getting smaller.
-        cum_ero = self.grid.at_node["cumulative_elevation_change"]
-        cum_ero[:] = (
-            self.z - self.grid.at_node["initial_topographic__elevation"]
-        )
-        self.threshold[:] = self.threshold_value - (
-            self.thresh_change_per_depth * cum_ero
-        )
-        self.threshold[
-            self.threshold < self.threshold_value
-        ] = self.threshold_value
+        # The floor at the initial value handles the case where there is
+        # growth, in which case we want the threshold to stay at its initial
+        # value rather than getting smaller.
+        dthresh = self.thresh_change_per_depth
+        thresh_val = self.threshold_value
+        threshold = self.threshold
+        cum_ero = self._cum_ero
+
+        np.subtract(self.z, self._init_z, out=cum_ero)
+
+        # Without a depth dependence the threshold keeps its initial value, so
+        # there is no need to recompute it.
+        if dthresh == 0.0:
+            return
+
+        np.multiply(cum_ero, -dthresh, out=threshold)
+        threshold += thresh_val
+        np.maximum(threshold, thresh_val, out=threshold)
 
     def run_one_step(self, step):
         """Advance model **BasicDdRt** for one time-step of duration step.
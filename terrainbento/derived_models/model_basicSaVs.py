@@ -162,11 +162,26 @@ class BasicSaVs(ErosionModel):
         self.K = water_erodibility
 
         soil_thickness = self.grid.at_node["soil__depth"]
-        bedrock_elev = self.grid.add_zeros("node", "bedrock__elevation")
-        bedrock_elev[:] = self.z - soil_thickness
+        self._bedrock = self.grid.add_zeros("node", "bedrock__elevation")
+        self._bedrock[:] = self.z - soil_thickness
 
-        # Get the effective-area parameter
+        # Get the effective-area parameter, and its negative for use in the
+        # exponent of the effective-area calculation
         self._Kdx = hydraulic_conductivity * self.grid.dx
+        self._neg_Kdx = -self._Kdx
+
+        # Bind the fields used to calculate effective drainage area. These
+        # are all updated in place, so the references remain valid.
+        self._core_nodes = self.grid.core_nodes
+        self._area = self.grid.at_node["drainage_area"]
+        self._slope = self.grid.at_node["topographic__steepest_slope"]
+        self._soil = self.grid.at_node["soil__depth"]
+        self._rain = self.grid.at_node["rainfall__flux"]
+        self._discharge = self.grid.at_node["surface_water__discharge"]
+        self._exp_arg = np.empty(self._core_nodes.size)
+        self._eff_area = np.empty_like(self._exp_arg)
+        self._area_safe = np.empty_like(self._exp_arg)
+        self._flooded = np.empty(self.grid.number_of_nodes, dtype=bool)
 
         # Instantiate a FastscapeEroder component
         self.eroder = FastscapeEroder(
@@ -192,21 +207,25 @@ class BasicSaVs(ErosionModel):
 
     def _calc_effective_drainage_area(self):
         """Calculate and store effective drainage area."""
-        area = self.grid.at_node["drainage_area"]
-        slope = self.grid.at_node["topographic__steepest_slope"]
-        cores = self.grid.core_nodes
-
-        sat_param = (
-            self._Kdx
-            * self.grid.at_node["soil__depth"]
-            / self.grid.at_node["rainfall__flux"]
-        )
-
-        eff_area = area[cores] * (
-            np.exp(-sat_param[cores] * slope[cores] / area[cores])
-        )
-
-        self.grid.at_node["surface_water__discharge"][cores] = eff_area
+        cores = self._core_nodes
+        exp_arg = self._exp_arg
+        eff_area = self._eff_area
+        np.take(self._area, cores, out=eff_area)
+
+        # Bound the divisor away from zero so that a node with no drainage
+        # area gets an effective area of zero rather than NaN.
+        np.maximum(eff_area, 1e-30, out=self._area_safe)
+
+        # Evaluate A exp(-alpha S / A) over the core nodes in place, where
+        # alpha is the saturation area scale.
+        np.multiply(self._soil[cores], self._neg_Kdx, out=exp_arg)
+        exp_arg /= self._rain[cores]
+        exp_arg *= self._slope[cores]
+        exp_arg /= self._area_safe
+        np.exp(exp_arg, out=exp_arg)
+        eff_area *= exp_arg
+
+        self._discharge[cores] = eff_area
 
     def run_one_step(self, step):
         """Advance model **BasicVs** for one time-step of duration step.
@@ -243,22 +262,17 @@ class BasicSaVs(ErosionModel):
         self._calc_effective_drainage_area()
 
         # Zero out effective area in flooded nodes
-        if self._erode_flooded_nodes:
-            flooded_nodes = []
-        else:
+        if not self._erode_flooded_nodes:
             flood_status = self.grid.at_node["flood_status_code"]
-            flooded_nodes = np.nonzero(flood_status == _FLOODED)[0]
-
-        self.grid.at_node["surface_water__discharge"][flooded_nodes] = 0.0
+            np.equal(flood_status, _FLOODED, out=self._flooded)
+            np.copyto(self._discharge, 0.0, where=self._flooded)
 
         # Do some erosion (but not on the flooded nodes)
         # (if we're varying K through time, update that first)
-        if "PrecipChanger" in self.boundary_handlers:
+        if self._precip_changer is not None:
             self.eroder.K = (
                 self.K
-                * self.boundary_handlers[
-                    "PrecipChanger"
-                ].get_erodibility_adjustment_factor()
+                * self._precip_changer.get_erodibility_adjustment_factor()
             )
         self.eroder.run_one_step(step)
 
@@ -266,8 +280,7 @@ class BasicSaVs(ErosionModel):
         # into bedrock has occurred, the bedrock elevation will be higher than
         # the actual elevation, so we simply re-set bedrock elevation to the
         # lower of itself or the current elevation.
-        b = self.grid.at_node["bedrock__elevation"]
-        b[:] = np.minimum(b, self.grid.at_node["topographic__elevation"])
+        np.minimum(self._bedrock, self.z, out=self._bedrock)
 
         # Calculate regolith-production rate
         self.weatherer.calc_soil_prod_rate()
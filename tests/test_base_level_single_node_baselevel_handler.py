@@ -3,9 +3,9 @@
 
 import os
 
-import numpy as np
 import pytest
 from landlab import HexModelGrid, RasterModelGrid
+from numpy.testing import assert_array_almost_equal
 
 from terrainbento.boundary_handlers import SingleNodeBaselevelHandler
 
@@ -21,8 +21,8 @@ def test_hex():
     bh = SingleNodeBaselevelHandler(mg, outlet_id=0, lowering_rate=-0.1)
     bh.run_one_step(10.0)
 
-    assert z[1] == 0.0
-    assert z[0] == -1.0
+    assert_array_almost_equal(z[1], 0.0)
+    assert_array_almost_equal(z[0], -1.0)
 
 
 def test_passing_neither_lowering_method():
@@ -70,11 +70,11 @@ def test_outlet_lowering_rate_no_scaling_bedrock():
     for _ in range(240):
         bh.run_one_step(10)
 
-    assert z[1] == 1.0
-    assert b[1] == 0.0
+    assert_array_almost_equal(z[1], 1.0)
+    assert_array_almost_equal(b[1], 0.0)
 
-    assert z[node_id] == -239.0
-    assert b[node_id] == -240.0
+    assert_array_almost_equal(z[node_id], -239.0)
+    assert_array_almost_equal(b[node_id], -240.0)
 
 
 def test_outlet_lowering_rate_on_not_outlet():
@@ -91,12 +91,12 @@ def test_outlet_lowering_rate_on_not_outlet():
     for _ in range(240):
         bh.run_one_step(10)
 
-    assert z[node_id] == 1.0
-    assert b[node_id] == 0.0
+    assert_array_almost_equal(z[node_id], 1.0)
+    assert_array_almost_equal(b[node_id], 0.0)
 
     not_outlet = mg.nodes != node_id
-    assert np.all(z[not_outlet] == 241.0)
-    assert np.all(b[not_outlet] == 240.0)
+    assert_array_almost_equal(z[not_outlet], 241.0)
+    assert_array_almost_equal(b[not_outlet], 240.0)
 
 
 def test_outlet_lowering_object_no_scaling_bedrock():
@@ -114,11 +114,11 @@ def test_outlet_lowering_object_no_scaling_bedrock():
     for _ in range(241):
         bh.run_one_step(10)
 
-    assert z[1] == 1.0
-    assert b[1] == 0.0
+    assert_array_almost_equal(z[1], 1.0)
+    assert_array_almost_equal(b[1], 0.0)
 
-    assert z[node_id] == -46.5
-    assert b[node_id] == -47.5
+    assert_array_almost_equal(z[node_id], -46.5)
+    assert_array_almost_equal(b[node_id], -47.5)
 
 
 def test_outlet_lowering_object_no_scaling():
@@ -134,8 +134,8 @@ def test_outlet_lowering_object_no_scaling():
     for _ in range(241):
         bh.run_one_step(10)
 
-    assert z[1] == 0.0
-    assert bh.z[node_id] == -47.5
+    assert_array_almost_equal(z[1], 0.0)
+    assert_array_almost_equal(bh.z[node_id], -47.5)
 
 
 def test_outlet_lowering_object_with_scaling():
@@ -155,8 +155,8 @@ def test_outlet_lowering_object_with_scaling():
     for _ in range(241):
         bh.run_one_step(10)
 
-    assert bh.z[node_id] == -95.0
-    assert z[1] == 0.0
+    assert_array_almost_equal(bh.z[node_id], -95.0)
+    assert_array_almost_equal(z[1], 0.0)
 
 
 def test_outlet_lowering_modify_other_nodes():
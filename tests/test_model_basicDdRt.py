@@ -58,3 +58,28 @@ def test_steady_Ksp_no_precip_changer_no_thresh_change(
     assert np.all(actual_slopes[22:37] > rock_predicted_slopes[22:37])
     # assert actual slopes are steeper than simple stream power prediction
     assert np.all(actual_slopes[82:97] > till_predicted_slopes[82:97])
+
+
+def test_threshold_shared_with_eroder(clock_simple, grid_2, U, Kr, Kt):
+    ncnblh = NotCoreNodeBaselevelHandler(
+        grid_2, modify_core_nodes=False, lowering_rate=-U
+    )
+    params = {
+        "grid": grid_2,
+        "clock": clock_simple,
+        "water_erodibility_lower": Kr,
+        "water_erodibility_upper": Kt,
+        "water_erosion_rule__threshold": 0.1,
+        "water_erosion_rule__thresh_depth_derivative": 0.5,
+        "boundary_handlers": {"NotCoreNodeBaselevelHandler": ncnblh},
+    }
+
+    model = BasicDdRt(**params)
+    for _ in range(100):
+        model.run_one_step(1000)
+
+    # the threshold increases as erosion occurs and the eroder sees the
+    # updated values without them being passed in again.
+    assert np.any(model.threshold > 0.1)
+    assert np.shares_memory(model.eroder.thresholds, model.threshold)
+    np.testing.assert_array_equal(model.eroder.thresholds, model.threshold)
@@ -47,3 +47,18 @@ def test_detachment_steady_no_precip_changer(
         actual_slopes[model.grid.core_nodes[1:-1]],
         predicted_slopes[model.grid.core_nodes[1:-1]],
     )
+
+
+def test_effective_area_with_no_drainage_area(clock_simple, grid_1):
+    grid_1.at_node["soil__depth"][:] = 0
+    model = BasicSaVs(clock=clock_simple, grid=grid_1)
+
+    # before flow is routed, core nodes have no drainage area or slope.
+    model.grid.at_node["drainage_area"][:] = 0.0
+    model.grid.at_node["topographic__steepest_slope"][:] = 0.0
+    model._calc_effective_drainage_area()
+
+    assert_array_almost_equal(
+        model.grid.at_node["surface_water__discharge"][model.grid.core_nodes],
+        0.0,
+    )